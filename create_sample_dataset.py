@@ -4,19 +4,149 @@ Federal Bill Sample Dataset Creator
 Analyzes bills by impact on people's lives and creates a representative sample
 """
 
+from array import array
+import bisect
+import heapq
 import json
 import os
 import shutil
 import re
+import subprocess
+import tempfile
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import random
 
 
+# Keywords for impact assessment
+HIGH_IMPACT_KEYWORDS = (
+    "healthcare",
+    "medicare",
+    "medicaid",
+    "prescription",
+    "drug",
+    "health insurance",
+    "tax",
+    "taxes",
+    "wage",
+    "wages",
+    "benefit",
+    "benefits",
+    "unemployment",
+    "student loan",
+    "education funding",
+    "school",
+    "tuition",
+    "housing",
+    "rent",
+    "mortgage",
+    "affordable housing",
+    "consumer protection",
+    "privacy",
+    "financial services",
+    "banking",
+    "immigration",
+    "refugee",
+    "asylum",
+    "family reunification",
+    "social security",
+    "disability",
+    "veterans benefits",
+)
+
+MEDIUM_IMPACT_KEYWORDS = (
+    "infrastructure",
+    "road",
+    "bridge",
+    "internet",
+    "broadband",
+    "utility",
+    "environment",
+    "air quality",
+    "water quality",
+    "climate",
+    "pollution",
+    "technology",
+    "artificial intelligence",
+    "ai",
+    "data privacy",
+    "digital rights",
+    "veterans",
+    "military benefits",
+    "small business",
+    "entrepreneur",
+    "transportation",
+    "public transit",
+    "safety",
+    "traffic",
+)
+
+LOW_IMPACT_KEYWORDS = (
+    "post office",
+    "naming",
+    "commemorative",
+    "resolution",
+    "designation",
+    "government operations",
+    "agency reorganization",
+    "administrative",
+    "military equipment",
+    "defense contract",
+    "base",
+    "facility",
+    "treaty",
+    "sanctions",
+    "foreign policy",
+    "diplomatic",
+)
+
+ADMINISTRATIVE_KEYWORDS = (
+    "post office",
+    "naming",
+    "commemorative",
+    "designation",
+    "resolution",
+    "administrative",
+    "procedural",
+    "government operations",
+)
+
+# Bump when keywords or scoring rules change, so cached analyses are redone
+ANALYSIS_CACHE_VERSION = 2
+
+# Every impact keyword tagged with its category index, in the order of
+# BillAnalyzer._impact_level's arguments
+_KEYWORDS = tuple(
+    (category, keyword)
+    for category, keywords in enumerate(
+        (HIGH_IMPACT_KEYWORDS, MEDIUM_IMPACT_KEYWORDS, LOW_IMPACT_KEYWORDS)
+    )
+    for keyword in keywords
+)
+
+
 class BillAnalyzer:
-    def __init__(self, bills_dir):
+    def __init__(self, bills_dir, seed=None, keep_metadata=False, cache_file=None):
         self.bills_dir = Path(bills_dir)
-        self.bills_data = []
+        self.rng = random.Random(seed)
+        self.keep_metadata = keep_metadata
+        # Cached rows hold no full metadata, so caching is off when it is kept
+        self.cache_file = Path(cache_file) if cache_file and not keep_metadata else None
+
+        # Bill data is stored column-wise; impact categories hold row indices
+        self.bills_data = {
+            "path": [],
+            "identifier": [],
+            "title": [],
+            "impact_level": [],
+            "progression_score": array("l"),
+            "cosponsor_count": array("l"),
+            "actions_count": array("l"),
+        }
+        # Full metadata documents are only retained on request
+        if keep_metadata:
+            self.bills_data["metadata"] = []
         self.impact_categories = {
             "high_impact": [],
             "medium_impact": [],
@@ -24,137 +154,120 @@ class BillAnalyzer:
             "mixed_impact": [],
         }
 
-        # Keywords for impact assessment
-        self.high_impact_keywords = [
-            "healthcare",
-            "medicare",
-            "medicaid",
-            "prescription",
-            "drug",
-            "health insurance",
-            "tax",
-            "taxes",
-            "wage",
-            "wages",
-            "benefit",
-            "benefits",
-            "unemployment",
-            "student loan",
-            "education funding",
-            "school",
-            "tuition",
-            "housing",
-            "rent",
-            "mortgage",
-            "affordable housing",
-            "consumer protection",
-            "privacy",
-            "financial services",
-            "banking",
-            "immigration",
-            "refugee",
-            "asylum",
-            "family reunification",
-            "social security",
-            "disability",
-            "veterans benefits",
-        ]
-
-        self.medium_impact_keywords = [
-            "infrastructure",
-            "road",
-            "bridge",
-            "internet",
-            "broadband",
-            "utility",
-            "environment",
-            "air quality",
-            "water quality",
-            "climate",
-            "pollution",
-            "technology",
-            "artificial intelligence",
-            "ai",
-            "data privacy",
-            "digital rights",
-            "veterans",
-            "military benefits",
-            "small business",
-            "entrepreneur",
-            "transportation",
-            "public transit",
-            "safety",
-            "traffic",
-        ]
-
-        self.low_impact_keywords = [
-            "post office",
-            "naming",
-            "commemorative",
-            "resolution",
-            "designation",
-            "government operations",
-            "agency reorganization",
-            "administrative",
-            "military equipment",
-            "defense contract",
-            "base",
-            "facility",
-            "treaty",
-            "sanctions",
-            "foreign policy",
-            "diplomatic",
-        ]
-
-        self.administrative_keywords = [
-            "post office",
-            "naming",
-            "commemorative",
-            "designation",
-            "resolution",
-            "administrative",
-            "procedural",
-            "government operations",
-        ]
+        # Impact levels by analysis text; companion bills often share titles
+        self._impact_by_text = {}
 
     def load_bill_metadata(self, bill_path):
         """Load metadata for a single bill"""
         metadata_file = bill_path / "metadata.json"
-        if not metadata_file.exists():
-            return None
-
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(metadata_file.read_bytes())
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading {metadata_file}: {e}")
             return None
 
-    def analyze_bill_impact(self, bill_data):
-        """Analyze bill impact based on title and description"""
-        if not bill_data:
-            return "mixed_impact"
+    def _metadata_signature(self, bill_path):
+        """Return the (mtime, size) of a bill's metadata file for caching"""
+        if self.cache_file is None:
+            return None
+        try:
+            stat = (bill_path / "metadata.json").stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_cache(self):
+        """Load cached analysis rows keyed by bill path"""
+        if self.cache_file is None:
+            return {}
+        try:
+            cache = json.loads(self.cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading {self.cache_file}: {e}")
+            return {}
+
+        # Ignore caches from other versions or with an unexpected shape
+        if not isinstance(cache, dict):
+            return {}
+        bills = cache.get("bills")
+        if cache.get("version") != ANALYSIS_CACHE_VERSION or not isinstance(
+            bills, dict
+        ):
+            return {}
+
+        # Drop malformed entries so those bills are simply analyzed again
+        return {
+            path: entry
+            for path, entry in bills.items()
+            if isinstance(entry, dict)
+            and "signature" in entry
+            and self._is_valid_row(entry.get("row"))
+        }
+
+    def _is_valid_row(self, row):
+        """Check that a cached row matches the bills_data column layout"""
+        if not isinstance(row, list) or len(row) != len(self.bills_data) - 1:
+            return False
+
+        identifier, title, impact_level, *counts = row
+        return (
+            isinstance(identifier, str)
+            and isinstance(title, str)
+            and isinstance(impact_level, str)
+            and impact_level in self.impact_categories
+            and all(isinstance(count, int) for count in counts)
+        )
+
+    def _save_cache(self, rows):
+        """Save analysis rows so unchanged bills are skipped on the next run"""
+        cache = {
+            "version": ANALYSIS_CACHE_VERSION,
+            "bills": {
+                str(bill_dir): {"signature": signature, "row": row}
+                for bill_dir, signature, row in rows
+                if signature is not None
+            },
+        }
+        # Write to a temporary file first so an interrupted run cannot leave
+        # a truncated cache behind
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            f = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_file.parent, delete=False
+            )
+        except OSError as e:
+            print(f"Error saving {self.cache_file}: {e}")
+            return
 
-        # Combine title and other titles for analysis
-        text_to_analyze = bill_data.get("title", "").lower()
-        for other_title in bill_data.get("other_titles", []):
-            text_to_analyze += " " + other_title.get("title", "").lower()
+        try:
+            with f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(f.name, self.cache_file)
+        except Exception as e:
+            os.unlink(f.name)
+            print(f"Error saving {self.cache_file}: {e}")
 
+    def _classify_text(self, text_to_analyze):
+        """Determine the impact level of a lowercased text"""
         # Check for administrative bills first
-        if any(keyword in text_to_analyze for keyword in self.administrative_keywords):
-            return "low_impact"
+        for keyword in ADMINISTRATIVE_KEYWORDS:
+            if keyword in text_to_analyze:
+                return "low_impact"
 
         # Count keyword matches
-        high_count = sum(
-            1 for keyword in self.high_impact_keywords if keyword in text_to_analyze
-        )
-        medium_count = sum(
-            1 for keyword in self.medium_impact_keywords if keyword in text_to_analyze
-        )
-        low_count = sum(
-            1 for keyword in self.low_impact_keywords if keyword in text_to_analyze
-        )
+        counts = [0, 0, 0]
+        for category, keyword in _KEYWORDS:
+            if keyword in text_to_analyze:
+                counts[category] += 1
 
+        return self._impact_level(*counts)
+
+    def _impact_level(self, high_count, medium_count, low_count):
+        """Determine impact level from keyword match counts"""
         # Determine impact level
         if high_count >= 2 or (high_count >= 1 and medium_count >= 1):
             return "high_impact"
@@ -169,85 +282,144 @@ class BillAnalyzer:
         else:
             return "mixed_impact"
 
-    def get_bill_progression_score(self, bill_data):
-        """Calculate progression score based on actions"""
-        if not bill_data or "actions" not in bill_data:
-            return 0
+    # Both alternatives contain "report", which is checked first so the regex
+    # only runs on the few actions that mention a report
+    _REPORTED_PATTERN = re.compile(r"committee.*?report|ordered.*?reported")
+
+    def _process_bill(self, bill_data):
+        """Analyze a bill's impact and progression in one pass over its data
+
+        Returns a row in bills_data column order, without the path.
+        """
+        # Combine title and other titles for analysis, lowercasing only once
+        title = bill_data.get("title", "")
+        titles = [title]
+        titles.extend(
+            other_title.get("title", "")
+            for other_title in bill_data.get("other_titles", [])
+        )
+        text_to_analyze = " ".join(titles).lower()
 
-        actions = bill_data["actions"]
-        score = 0
+        impact_level = self._impact_by_text.get(text_to_analyze)
+        if impact_level is None:
+            impact_level = self._classify_text(text_to_analyze)
+            self._impact_by_text[text_to_analyze] = impact_level
 
+        # Calculate progression score based on actions
+        actions = bill_data.get("actions", [])
+        progression_score = 0
         for action in actions:
             description = action.get("description", "").lower()
             classification = action.get("classification", [])
 
             # High progression indicators
             if "became law" in description or "became-law" in classification:
-                score += 100
+                progression_score += 100
             elif (
                 "signed by president" in description
                 or "executive-signature" in classification
             ):
-                score += 90
+                progression_score += 90
             elif "passed" in description and (
                 "house" in description or "senate" in description
             ):
-                score += 80
-            elif (
-                "committee.*report" in description or "ordered.*reported" in description
+                progression_score += 80
+            elif "report" in description and self._REPORTED_PATTERN.search(
+                description
             ):
-                score += 60
+                progression_score += 60
             elif "committee consideration" in description or "markup" in description:
-                score += 40
+                progression_score += 40
             elif "referred" in description:
-                score += 10
+                progression_score += 10
             elif "introduced" in description:
-                score += 5
-
-        return score
+                progression_score += 5
+
+        return (
+            bill_data.get("identifier", ""),
+            title,
+            impact_level,
+            progression_score,
+            len(bill_data.get("sponsorships", [])),
+            len(actions),
+        )
 
     def analyze_all_bills(self):
         """Analyze all bills in the directory"""
         print("Analyzing bills for impact on people's lives...")
 
-        bill_dirs = [d for d in self.bills_dir.iterdir() if d.is_dir()]
+        # DirEntry caches the file type from the directory listing, so this
+        # avoids a stat call per bill directory
+        with os.scandir(self.bills_dir) as entries:
+            bill_dirs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
         total_bills = len(bill_dirs)
 
-        for i, bill_dir in enumerate(bill_dirs):
-            if i % 500 == 0:
-                print(f"Processed {i}/{total_bills} bills...")
+        # Bills whose metadata file is unchanged since the last run reuse
+        # their cached analysis instead of being parsed again
+        cached_rows = self._load_cache()
+
+        def load_bill(bill_dir):
+            signature = self._metadata_signature(bill_dir)
+            cached = cached_rows.get(str(bill_dir))
+            if cached and cached["signature"] == signature:
+                return signature, cached["row"], True
 
             bill_data = self.load_bill_metadata(bill_dir)
             if not bill_data:
-                continue
-
-            impact_level = self.analyze_bill_impact(bill_data)
-            progression_score = self.get_bill_progression_score(bill_data)
-
-            bill_info = {
-                "path": bill_dir,
-                "identifier": bill_data.get("identifier", ""),
-                "title": bill_data.get("title", ""),
-                "impact_level": impact_level,
-                "progression_score": progression_score,
-                "cosponsor_count": len(bill_data.get("sponsorships", [])),
-                "actions_count": len(bill_data.get("actions", [])),
-                "metadata": bill_data,
-            }
-
-            self.bills_data.append(bill_info)
-            self.impact_categories[impact_level].append(bill_info)
-
-        print(f"Analysis complete! Found {len(self.bills_data)} bills:")
+                return signature, None, False
+            row = self._process_bill(bill_data)
+            if self.keep_metadata:
+                row += (bill_data,)
+            return signature, row, False
+
+        # Metadata loading is I/O bound, so overlap the reads across threads.
+        # Workers reduce each document to its row, so full documents are
+        # freed early.
+        rows = []
+        reused_count = 0
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = executor.map(load_bill, bill_dirs)
+            for i, (bill_dir, result) in enumerate(zip(bill_dirs, results)):
+                if i % 500 == 0:
+                    print(f"Processed {i}/{total_bills} bills...")
+
+                signature, row, from_cache = result
+                if row is None:
+                    continue
+                reused_count += from_cache
+                rows.append((bill_dir, signature, row))
+
+        if self.cache_file is not None:
+            print(f"Reused {reused_count} cached bill analyses")
+
+        # Rows follow bills_data column order; strict catches any mismatch
+        columns = self.bills_data.values()
+        for bill_dir, _, row in rows:
+            for values, value in zip(columns, (bill_dir, *row), strict=True):
+                values.append(value)
+        for index, impact_level in enumerate(self.bills_data["impact_level"]):
+            self.impact_categories[impact_level].append(index)
+
+        if self.cache_file is not None:
+            self._save_cache(rows)
+
+        print(f"Analysis complete! Found {len(rows)} bills:")
         for category, bills in self.impact_categories.items():
             print(f"  {category}: {len(bills)} bills")
 
+    def _bill_record(self, index):
+        """Build the bill info dict for a single row of bills_data"""
+        return {column: values[index] for column, values in self.bills_data.items()}
+
     def select_sample_bills(self, target_total=250):
         """Select representative sample of bills"""
         print(f"\nSelecting sample of {target_total} bills...")
 
         # Calculate target distribution
-        total_bills = len(self.bills_data)
         high_impact_ratio = 0.3  # 30% high impact
         medium_impact_ratio = 0.4  # 40% medium impact
         low_impact_ratio = 0.2  # 20% low impact
@@ -260,6 +432,8 @@ class BillAnalyzer:
             "mixed_impact": int(target_total * mixed_impact_ratio),
         }
 
+        progression_scores = self.bills_data["progression_score"]
+        cosponsor_counts = self.bills_data["cosponsor_count"]
         selected_bills = []
 
         for category, target_count in targets.items():
@@ -270,23 +444,25 @@ class BillAnalyzer:
                 selected_bills.extend(available_bills)
                 print(f"  {category}: Selected all {len(available_bills)} bills")
             else:
-                # Sort by progression score and cosponsor count, then sample
-                sorted_bills = sorted(
+                # Rank only the highest scoring bills by progression score and
+                # cosponsor count, rather than sorting the whole category
+                ranked_bills = heapq.nlargest(
+                    target_count * 3,
                     available_bills,
-                    key=lambda x: (x["progression_score"], x["cosponsor_count"]),
-                    reverse=True,
+                    key=lambda i: (progression_scores[i], cosponsor_counts[i]),
                 )
 
-                # Take top 60% by progression, then random sample from rest
+                # Take top 60% by progression, then random sample from the
+                # rest of the ranked pool
                 top_count = int(target_count * 0.6)
                 random_count = target_count - top_count
 
-                selected = sorted_bills[:top_count]
-                remaining = sorted_bills[top_count:]
+                selected = ranked_bills[:top_count]
+                remaining = ranked_bills[top_count:]
 
                 if random_count > 0 and remaining:
                     selected.extend(
-                        random.sample(remaining, min(random_count, len(remaining)))
+                        self.rng.sample(remaining, min(random_count, len(remaining)))
                     )
 
                 selected_bills.extend(selected)
@@ -295,9 +471,9 @@ class BillAnalyzer:
                 )
 
         print(f"\nTotal selected: {len(selected_bills)} bills")
-        return selected_bills
+        return [self._bill_record(index) for index in selected_bills]
 
-    def create_sample_dataset(self, selected_bills, output_dir):
+    def create_sample_dataset(self, selected_bills, output_dir, use_tar=False):
         """Create the sample dataset by copying selected bills"""
         print(f"\nCreating sample dataset in {output_dir}...")
 
@@ -305,66 +481,109 @@ class BillAnalyzer:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Copy each selected bill
-        for i, bill_info in enumerate(selected_bills):
-            if i % 50 == 0:
-                print(f"  Copied {i}/{len(selected_bills)} bills...")
-
-            source_path = bill_info["path"]
-            dest_path = output_path / source_path.name
+        source_paths = [
+            bill_info["path"]
+            for bill_info in selected_bills
+            if bill_info["path"].exists()
+        ]
 
-            # Copy entire bill directory
-            if source_path.exists():
-                shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+        if use_tar and shutil.which("tar"):
+            # Stream the whole sample through a single tar pipe
+            print(f"  Streaming {len(source_paths)} bills through tar...")
+            self._tar_copy_bills(source_paths, output_path)
+        else:
+            # Copy each selected bill
+            for i, source_path in enumerate(source_paths):
+                if i % 50 == 0:
+                    print(f"  Copied {i}/{len(source_paths)} bills...")
+
+                # Copy entire bill directory
+                shutil.copytree(
+                    source_path, output_path / source_path.name, dirs_exist_ok=True
+                )
 
         print(f"Sample dataset created with {len(selected_bills)} bills!")
 
         # Create summary report
         self.create_summary_report(selected_bills, output_path)
 
+    def _tar_copy_bills(self, source_paths, output_path):
+        """Stream bill directories into the output directory through tar"""
+        names_by_parent = defaultdict(list)
+        for source_path in source_paths:
+            names_by_parent[source_path.parent].append(source_path.name)
+
+        for parent, names in names_by_parent.items():
+            with tempfile.NamedTemporaryFile("w", suffix=".txt") as file_list:
+                file_list.write("\n".join(names) + "\n")
+                file_list.flush()
+
+                # Both processes are waited on when their with blocks exit
+                with subprocess.Popen(
+                    ["tar", "-cf", "-", "-C", str(parent), "-T", file_list.name],
+                    stdout=subprocess.PIPE,
+                ) as archiver:
+                    with subprocess.Popen(
+                        ["tar", "-xf", "-", "-C", str(output_path)],
+                        stdin=archiver.stdout,
+                    ) as extractor:
+                        # Drop our end of the pipe so the archiver gets
+                        # SIGPIPE if the extractor exits early
+                        archiver.stdout.close()
+
+                for process in (extractor, archiver):
+                    if process.returncode != 0:
+                        raise subprocess.CalledProcessError(
+                            process.returncode, process.args
+                        )
+
+    _BILL_TYPE_PATTERN = re.compile(r"HR|S|HJRES|HCONRES")
+    _BILL_TYPES = {
+        "HR": "House Bills",
+        "S": "Senate Bills",
+        "HJRES": "Joint Resolutions",
+        "HCONRES": "Concurrent Resolutions",
+    }
+
+    def _bill_type(self, identifier):
+        """Determine the report bill type from the identifier prefix"""
+        match = self._BILL_TYPE_PATTERN.match(identifier)
+        if match:
+            return self._BILL_TYPES[match.group()]
+
+        # Fall back to resolution markers anywhere in the identifier
+        if "JRES" in identifier:
+            return "Joint Resolutions"
+        if "CONRES" in identifier:
+            return "Concurrent Resolutions"
+        return None
+
+    # Progression scores at or above each threshold fall in the next bucket:
+    # introduced only, committee activity, passed a chamber, became law
+    _PROGRESSION_THRESHOLDS = (30, 70, 90)
+
     def create_summary_report(self, selected_bills, output_path):
         """Create a summary report of the sample dataset"""
+        progression_buckets = Counter(
+            bisect.bisect_right(self._PROGRESSION_THRESHOLDS, bill["progression_score"])
+            for bill in selected_bills
+        )
+        bill_types = (self._bill_type(bill["identifier"]) for bill in selected_bills)
+
         report = {
             "total_bills": len(selected_bills),
             "creation_date": str(Path().cwd()),
-            "impact_distribution": defaultdict(int),
-            "bill_types": defaultdict(int),
+            "impact_distribution": Counter(
+                bill["impact_level"] for bill in selected_bills
+            ),
+            "bill_types": Counter(bill_type for bill_type in bill_types if bill_type),
             "progression_stats": {
-                "became_law": 0,
-                "passed_chamber": 0,
-                "committee_activity": 0,
-                "introduced_only": 0,
+                "became_law": progression_buckets[3],
+                "passed_chamber": progression_buckets[2],
+                "committee_activity": progression_buckets[1],
+                "introduced_only": progression_buckets[0],
             },
-            "sample_bills": [],
-        }
-
-        for bill in selected_bills:
-            # Impact distribution
-            report["impact_distribution"][bill["impact_level"]] += 1
-
-            # Bill types
-            identifier = bill["identifier"]
-            if identifier.startswith("HR"):
-                report["bill_types"]["House Bills"] += 1
-            elif identifier.startswith("S"):
-                report["bill_types"]["Senate Bills"] += 1
-            elif "JRES" in identifier:
-                report["bill_types"]["Joint Resolutions"] += 1
-            elif "CONRES" in identifier:
-                report["bill_types"]["Concurrent Resolutions"] += 1
-
-            # Progression stats
-            if bill["progression_score"] >= 90:
-                report["progression_stats"]["became_law"] += 1
-            elif bill["progression_score"] >= 70:
-                report["progression_stats"]["passed_chamber"] += 1
-            elif bill["progression_score"] >= 30:
-                report["progression_stats"]["committee_activity"] += 1
-            else:
-                report["progression_stats"]["introduced_only"] += 1
-
-            # Sample bill info
-            report["sample_bills"].append(
+            "sample_bills": [
                 {
                     "identifier": bill["identifier"],
                     "title": bill["title"],
@@ -372,7 +591,9 @@ class BillAnalyzer:
                     "progression_score": bill["progression_score"],
                     "cosponsor_count": bill["cosponsor_count"],
                 }
-            )
+                for bill in selected_bills
+            ],
+        }
 
         # Save report
         report_file = output_path / "sample_dataset_report.json"
@@ -387,6 +608,8 @@ def main():
     current_bills_dir = "/Users/tamara/tad_code.nosync/current_projects/CHN/SAMPLE-DATA-SETS/usa-data-pipeline-SAMPLE/data_output/data_processed/country:us/congress/sessions/119/bills"
     backup_dir = "/Users/tamara/tad_code.nosync/current_projects/CHN/SAMPLE-DATA-SETS/usa-data-pipeline-SAMPLE/data_output/data_processed/country:us/congress/sessions/119/bills_full_dataset"
     new_bills_dir = "/Users/tamara/tad_code.nosync/current_projects/CHN/SAMPLE-DATA-SETS/usa-data-pipeline-SAMPLE/data_output/data_processed/country:us/congress/sessions/119/bills"
+    # Set to a path outside data_output to reuse analyses of unchanged bills
+    analysis_cache_file = None
 
     print("Federal Bill Sample Dataset Creator")
     print("=" * 50)
@@ -404,7 +627,7 @@ def main():
 
     # Step 2: Analyze bills
     print(f"\nStep 2: Analyzing bills from backup")
-    analyzer = BillAnalyzer(backup_dir)
+    analyzer = BillAnalyzer(backup_dir, cache_file=analysis_cache_file)
     analyzer.analyze_all_bills()
 
     # Step 3: Select sample